@@ -2,20 +2,23 @@
 Main Streamlit application for PDF Image Extractor.
 """
 import streamlit as st
+import time
 from pathlib import Path
-from typing import Optional, Dict, List
-import traceback
+from typing import Optional, Dict, List, Tuple
 
 # Import our modules
-from config import create_directories, OUTPUT_FOLDER
+from config import create_directories, OUTPUT_FOLDER, PROGRESS_UPDATE_INTERVAL
 from logger import setup_logger
 from exceptions import PDFExtractorError, FileValidationError, FileOperationError
-from utils import save_uploaded_file, clear_output_folder, zip_images, validate_pdf_file
-from extract import extract_images_with_progress
+from utils import (
+    save_uploaded_file, clear_output_folder, zip_images, validate_pdf_file,
+    compute_file_hash, borrow_pdf
+)
+from extract import PDFImageExtractor
 from ui_components import (
     render_header, render_file_uploader, render_progress_bar, 
     render_extraction_results, render_error_message,
-    render_info_section, render_footer, render_sidebar
+    render_info_section, render_footer, render_sidebar, load_thumbnail
 )
 
 # Setup logging
@@ -45,8 +48,7 @@ def main():
         render_footer()
         
     except Exception as e:
-        logger.error(f"Application error: {e}")
-        logger.error(traceback.format_exc())
+        logger.error("Application error: %s", e, exc_info=True)
         st.error("An unexpected error occurred. Please try again.")
 
 def process_uploaded_file(uploaded_file, settings: Dict):
@@ -58,40 +60,32 @@ def process_uploaded_file(uploaded_file, settings: Dict):
         settings: Dictionary containing user settings
     """
     try:
-        # Save uploaded file
-        file_path = save_uploaded_file(uploaded_file)
-        
-        # Validate PDF file
-        is_valid, error_message = validate_pdf_file(file_path)
-        if not is_valid:
-            render_error_message(error_message)
-            return
-        
-        # Clear output folder
-        clear_output_folder(OUTPUT_FOLDER)
-        
-        # Extract images with progress
-        with st.spinner("⏳ Extracting images..."):
-            # Create progress callback
-            progress_placeholder = st.empty()
-            
-            def progress_callback(current: int, total: int):
-                progress_placeholder.progress(current / total)
-                progress_placeholder.caption(f"Processing page {current} of {total}")
-            
-            # Extract images with logo filtering
-            image_paths, stats = extract_images_with_progress(
-                pdf_path=file_path,
-                output_folder=OUTPUT_FOLDER,
-                progress_callback=progress_callback,
-                filter_logos=settings.get('filter_logos', True)
-            )
-            
-            # Clear progress
-            progress_placeholder.empty()
+        filter_logos = settings.get('filter_logos', True)
+        # Hash each upload once; reruns reuse the digest until a different file is uploaded
+        digest = st.session_state.get("upload_digest")
+        if digest is None or digest[0] != uploaded_file.file_id:
+            digest = (uploaded_file.file_id, compute_file_hash(uploaded_file))
+            st.session_state.upload_digest = digest
+        file_hash = digest[1]
+        cache_key = (file_hash, filter_logos)
+        
+        # Reuse the previous extraction on reruns for the same file and settings
+        cached = st.session_state.get("extraction_cache")
+        if cached and cached["key"] == cache_key and all(Path(p).exists() for p in cached["image_paths"]):
+            image_paths, stats = cached["image_paths"], cached["stats"]
+        else:
+            result = run_extraction(uploaded_file, file_hash, filter_logos)
+            if result is None:
+                return
+            image_paths, stats = result
+            st.session_state.extraction_cache = {
+                "key": cache_key,
+                "image_paths": image_paths,
+                "stats": stats
+            }
         
         # Render results
-        render_extraction_results(image_paths, stats)
+        render_extraction_results(image_paths, stats, cache_key)
         
         # Apply settings if needed
         apply_user_settings(image_paths, settings)
@@ -103,10 +97,79 @@ def process_uploaded_file(uploaded_file, settings: Dict):
     except PDFExtractorError as e:
         render_error_message(str(e))
     except Exception as e:
-        logger.error(f"Error processing uploaded file: {e}")
-        logger.error(traceback.format_exc())
+        logger.error("Error processing uploaded file: %s", e, exc_info=True)
         render_error_message("An unexpected error occurred during processing.")
 
+def run_extraction(uploaded_file, file_hash: str, filter_logos: bool) -> Optional[Tuple[List[str], Dict]]:
+    """
+    Save, validate and extract images from the uploaded PDF file.
+    
+    Args:
+        uploaded_file: Streamlit uploaded file object
+        file_hash: Digest of the uploaded file contents
+        filter_logos: Whether to filter out logo-like images
+        
+    Returns:
+        Tuple of (image_paths, statistics), or None if the PDF is invalid
+    """
+    # Save uploaded file under its digest
+    file_path = save_uploaded_file(uploaded_file, file_hash)
+    
+    # Validate PDF file
+    is_valid, error_message = validate_pdf_file(file_path, file_hash)
+    if not is_valid:
+        render_error_message(error_message)
+        return None
+    
+    # Extract into a folder per file and setting, so sessions sharing the server (and
+    # leftover writes from an interrupted run) never touch each other's images
+    output_folder = str(Path(OUTPUT_FOLDER) / f"{file_hash}_{int(filter_logos)}")
+    
+    # Extract images with progress
+    with st.spinner("⏳ Extracting images..."):
+        # Create progress callback
+        progress_placeholder = st.empty()
+        last_update = [0.0]
+        
+        def progress_callback(current: int, total: int):
+            # Throttle UI updates, but always show the final state
+            now = time.monotonic()
+            if current != total and now - last_update[0] < PROGRESS_UPDATE_INTERVAL:
+                return
+            last_update[0] = now
+            progress_placeholder.progress(current / total)
+            progress_placeholder.caption(f"Processing page {current} of {total}")
+        
+        # Extract images with logo filtering, previewing them as they arrive
+        preview_placeholder = st.empty()
+        last_preview = 0.0
+        
+        # The document lock also keeps other sessions from clearing the folder mid-extraction
+        with borrow_pdf(file_hash, file_path) as pdf:
+            clear_output_folder(output_folder)
+            extractor = PDFImageExtractor(output_folder)
+            
+            for count, (image_path, running_stats) in enumerate(
+                extractor.iter_images(file_path, progress_callback, filter_logos, pdf),
+                start=1
+            ):
+                now = time.monotonic()
+                if now - last_preview >= PROGRESS_UPDATE_INTERVAL:
+                    # Images that can't be previewed are still extracted, just not shown here
+                    thumbnail = load_thumbnail(image_path)
+                    if thumbnail is not None:
+                        last_preview = now
+                        preview_placeholder.image(thumbnail, width=300, caption=f"{count} image(s) extracted so far")
+        
+        image_paths = extractor.extracted_images
+        stats = extractor.get_extraction_stats()
+        
+        # Clear progress and preview
+        progress_placeholder.empty()
+        preview_placeholder.empty()
+    
+    return image_paths, stats
+
 def apply_user_settings(image_paths: List[str], settings: Dict):
     """
     Apply user settings to the extracted images.
@@ -125,7 +188,7 @@ def apply_user_settings(image_paths: List[str], settings: Dict):
             st.info("Image optimization feature coming soon!")
             
     except Exception as e:
-        logger.error(f"Error applying user settings: {e}")
+        logger.error("Error applying user settings: %s", e)
 
 if __name__ == "__main__":
     main()
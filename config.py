@@ -3,7 +3,7 @@ Configuration settings for the PDF Image Extractor application.
 """
 import os
 from pathlib import Path
-from typing import List
+from typing import FrozenSet
 
 # Application settings
 APP_TITLE = "📄 PDF Image Extractor"
@@ -11,19 +11,33 @@ APP_LAYOUT = "centered"
 AUTHOR = "Zaarouri Abdelmounime"
 
 # File settings
-ALLOWED_EXTENSIONS = ["pdf"]
+ALLOWED_EXTENSIONS: FrozenSet[str] = frozenset({"pdf"})
 MAX_FILE_SIZE_MB = 50  # Maximum file size in MB
 UPLOAD_FOLDER = "uploads"
 OUTPUT_FOLDER = "extracted_images"
 TEMP_FOLDER = "temp"
+UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024  # Chunk size used when streaming uploads to disk
 
 # Image extraction settings
-SUPPORTED_IMAGE_FORMATS = ["jpeg", "jpg", "png", "gif", "bmp", "tiff"]
+SUPPORTED_IMAGE_FORMATS: FrozenSet[str] = frozenset({"jpeg", "jpg", "png", "gif", "bmp", "tiff"})
+# Formats that are already compressed and gain nothing from deflating in a ZIP
+PRECOMPRESSED_IMAGE_EXTENSIONS: FrozenSet[str] = frozenset({".jpeg", ".jpg", ".png", ".gif", ".webp"})
 DEFAULT_IMAGE_QUALITY = 95
 MIN_IMAGE_SIZE_KB = 1  # Minimum image size to save (in KB)
+LOGO_MAX_SIZE_KB = 10  # Images smaller than this are treated as logos when filtering
+WRITE_QUEUE_SIZE = 32  # Maximum images waiting for the background writer
+PARALLEL_IMAGE_THRESHOLD = 32  # Minimum image count before pages are extracted in a process pool
 
 # UI settings
 IFRAME_HEIGHT = 500
+STYLESHEET_FILE = "styles.css"
+THUMBNAIL_SIZE = (512, 512)  # Maximum preview thumbnail dimensions
+THUMBNAIL_QUALITY = 80  # JPEG quality for preview thumbnails
+IMAGE_CACHE_MAX_ENTRIES = 256  # Image payloads kept in the Streamlit data cache
+IMAGE_INFO_CACHE_MAX_ENTRIES = 512  # Image metadata lookups kept in the Streamlit data cache
+ZIP_CACHE_MAX_ENTRIES = 8  # ZIP archives kept in the Streamlit data cache
+ZIP_READ_WORKERS = 8  # Threads prefetching image files while a ZIP is written; also the read-ahead window
+PROGRESS_UPDATE_INTERVAL = 0.1  # Minimum seconds between progress bar updates
 SPINNER_TEXT = "⏳ Extracting images..."
 SUCCESS_MESSAGE = "✅ {count} image(s) extracted successfully."
 WARNING_MESSAGE = "⚠️ No images found in this PDF."
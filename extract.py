@@ -2,17 +2,41 @@
 PDF image extraction functionality.
 """
 import fitz  # PyMuPDF
+import multiprocessing
 import os
+import queue
+import threading
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
-from PIL import Image
-import io
+from typing import List, Dict, Iterator, Optional, Tuple
+import hashlib
+import struct
 from logger import get_logger
 from exceptions import PDFProcessingError, ImageExtractionError
-from config import OUTPUT_FOLDER, SUPPORTED_IMAGE_FORMATS, MIN_IMAGE_SIZE_KB, DEFAULT_IMAGE_QUALITY
+from config import (
+    OUTPUT_FOLDER, SUPPORTED_IMAGE_FORMATS, MIN_IMAGE_SIZE_KB, DEFAULT_IMAGE_QUALITY,
+    LOGO_MAX_SIZE_KB, PARALLEL_IMAGE_THRESHOLD, WRITE_QUEUE_SIZE
+)
 
 logger = get_logger(__name__)
 
+# Stream filters whose raw bytes are already a standalone image file
+RAW_STREAM_FORMATS = {
+    "/DCTDecode": "jpeg"
+}
+
+# PDF handle cached per worker process, keyed on (pdf_path, mtime)
+_worker_pdf = None
+_worker_pdf_key = None
+
+# Process pool shared by all extractions, started on first use and
+# abandoned for good if its workers die (e.g. the main module can't be re-imported)
+_pool = None
+_pool_broken = False
+_pool_lock = threading.Lock()
+
 class PDFImageExtractor:
     """
     A class to handle PDF image extraction with enhanced features.
@@ -27,6 +51,8 @@ class PDFImageExtractor:
         """
         self.output_folder = Path(output_folder)
         self.output_folder.mkdir(exist_ok=True)
+        # Plain string prefix so per-image paths avoid Path construction
+        self._out_prefix = str(self.output_folder) + os.sep
         self.extracted_images = []
         self.stats = {
             "total_pages": 0,
@@ -36,8 +62,18 @@ class PDFImageExtractor:
             "total_size_mb": 0.0,
             "filtered_logos": 0
         }
+        # Images already written, so repeated page furniture is only saved once
+        self._seen_xrefs = set()
+        self._seen_hashes = set()
+        # Content digest of each queued image, handed back by pool workers
+        self._digests = {}
+        # Background writer state, set up per extraction run
+        self._write_queue = None
+        self._writer = None
+        self._done_queue = None
     
-    def extract_images_from_pdf(self, pdf_path: str, progress_callback=None, filter_logos: bool = True) -> List[str]:
+    def extract_images_from_pdf(self, pdf_path: str, progress_callback=None, filter_logos: bool = True,
+                                pdf: Optional[fitz.Document] = None) -> List[str]:
         """
         Extract all images from a PDF file.
         
@@ -45,6 +81,7 @@ class PDFImageExtractor:
             pdf_path: Path to the PDF file
             progress_callback: Optional callback function for progress updates
             filter_logos: Whether to filter out logo-like images
+            pdf: Optional already opened document for pdf_path, left open afterwards
             
         Returns:
             List of paths to extracted images
@@ -53,34 +90,284 @@ class PDFImageExtractor:
             PDFProcessingError: If PDF processing fails
             ImageExtractionError: If image extraction fails
         """
+        for _ in self.iter_images(pdf_path, progress_callback, filter_logos, pdf):
+            pass
+        return self.extracted_images
+    
+    def iter_images(self, pdf_path: str, progress_callback=None, filter_logos: bool = True,
+                    pdf: Optional[fitz.Document] = None) -> Iterator[Tuple[str, Dict]]:
+        """
+        Extract images from a PDF file, yielding each one as soon as it is saved.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            progress_callback: Optional callback function for progress updates
+            filter_logos: Whether to filter out logo-like images
+            pdf: Optional already opened document for pdf_path, left open afterwards.
+                Process pool workers always reopen the file from pdf_path.
+            
+        Yields:
+            Tuples of (image_path, running_stats)
+            
+        Raises:
+            PDFProcessingError: If PDF processing fails
+        """
         try:
-            logger.info(f"Starting image extraction from: {pdf_path}")
+            logger.info("Starting image extraction from: %s", pdf_path)
             
             # Validate PDF file
             if not Path(pdf_path).exists():
                 raise PDFProcessingError(f"PDF file not found: {pdf_path}")
             
-            # Open PDF
-            with fitz.open(pdf_path) as pdf:
-                self.stats["total_pages"] = len(pdf)
-                logger.info(f"Processing PDF with {self.stats['total_pages']} pages")
+            # Open PDF (unless the caller passed one)
+            with nullcontext(pdf) if pdf is not None else fitz.open(pdf_path) as pdf:
+                total_pages = len(pdf)
+                self.stats["total_pages"] = total_pages
+                logger.info("Processing PDF with %s pages", total_pages)
                 
-                # Process each page
-                for page_index in range(len(pdf)):
-                    if progress_callback:
-                        progress_callback(page_index + 1, len(pdf))
+                # The pool only pays off with several CPUs and enough images to outweigh the IPC
+                skip_xrefs = None
+                if not _pool_broken and (os.cpu_count() or 1) > 1 and total_pages > 1:
+                    skip_xrefs, image_count = _assign_xrefs_to_pages(pdf)
+                    if image_count < PARALLEL_IMAGE_THRESHOLD:
+                        skip_xrefs = None
+                
+                if skip_xrefs is not None:
+                    # Spread pages across worker processes, which write their own images
+                    yield from self._iter_pages_parallel(pdf, pdf_path, skip_xrefs, progress_callback, filter_logos)
+                else:
+                    # Extract in this process, writing images in the background
+                    self._start_writer()
+                    for page_index in range(total_pages):
+                        if progress_callback:
+                            progress_callback(page_index + 1, total_pages)
+                        
+                        page = pdf[page_index]
+                        self._add_results(*self._extract_images_from_page(page, page_index, pdf, filter_logos))
+                        
+                        # Hand out images the writer has already saved, without waiting for the rest
+                        for path in self._collect_writes():
+                            yield path, self.get_extraction_stats()
                     
-                    page = pdf[page_index]
-                    self._extract_images_from_page(page, page_index, pdf, filter_logos)
+                    for path in self._stop_writer():
+                        yield path, self.get_extraction_stats()
                 
-                logger.info(f"Extraction completed. Stats: {self.stats}")
-                return self.extracted_images
+                logger.info("Extraction completed. Stats: %s", self.stats)
                 
         except Exception as e:
-            logger.error(f"Error during PDF processing: {e}")
+            logger.error("Error during PDF processing: %s", e)
             raise PDFProcessingError(f"Failed to process PDF: {e}")
+        finally:
+            if self._writer is not None:
+                self._stop_writer()
+    
+    def _start_writer(self) -> None:
+        """
+        Start the background thread that writes extracted images to disk.
+        """
+        self._write_queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self._done_queue = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
+    
+    def _writer_loop(self) -> None:
+        """
+        Write queued (path, bytes) items until the None sentinel is received,
+        reporting each one on the done queue as (path, size_bytes, written).
+        """
+        while True:
+            item = self._write_queue.get()
+            if item is None:
+                break
+            
+            path, data = item
+            try:
+                _write_bytes(path, data)
+            except Exception as e:
+                logger.error("Error writing image %s: %s", path, e)
+                self._done_queue.put((path, len(data), False))
+            else:
+                self._done_queue.put((path, len(data), True))
+    
+    def _collect_writes(self) -> List[str]:
+        """
+        Collect finished writes without waiting, dropping images that failed to save.
+        
+        Returns:
+            Paths written to disk since the last call, in write order
+        """
+        written = []
+        while True:
+            try:
+                path, size, ok = self._done_queue.get_nowait()
+            except queue.Empty:
+                return written
+            
+            if ok:
+                written.append(path)
+                continue
+            self.extracted_images.remove(path)
+            self.stats["successful_extractions"] -= 1
+            self.stats["total_images"] -= 1
+            self.stats["failed_extractions"] += 1
+            self.stats["total_size_mb"] -= size / (1024 * 1024)
+    
+    def _stop_writer(self) -> List[str]:
+        """
+        Finish pending writes and stop the writer thread.
+        
+        Returns:
+            Paths written to disk since the last collection
+        """
+        self._write_queue.put(None)
+        self._writer.join()
+        self._writer = None
+        return self._collect_writes()
+    
+    def _iter_pages_parallel(self, pdf, pdf_path: str, skip_xrefs: List[set], progress_callback=None,
+                             filter_logos: bool = True) -> Iterator[Tuple[str, Dict]]:
+        """
+        Extract images from all pages using the shared process pool.
+        
+        Args:
+            pdf: PDF document object
+            pdf_path: Path to the PDF file
+            skip_xrefs: Per page, the image xrefs handled by an earlier page
+            progress_callback: Optional callback function for progress updates
+            filter_logos: Whether to filter out logo-like images
+            
+        Yields:
+            Tuples of (image_path, running_stats) in page order
+        """
+        total_pages = len(pdf)
+        page_results = {}
+        next_page = 0
+        
+        executor = _get_pool()
+        futures = {}
+        try:
+            futures = {
+                executor.submit(
+                    _process_page, pdf_path, page_index, str(self.output_folder),
+                    filter_logos, skip_xrefs[page_index]
+                ): page_index
+                for page_index in range(total_pages)
+            }
+            
+            for completed, future in enumerate(as_completed(futures), start=1):
+                page_index = futures[future]
+                if progress_callback:
+                    progress_callback(completed, total_pages)
+                
+                try:
+                    page_results[page_index] = future.result()
+                except BrokenProcessPool as e:
+                    if _pool is executor:
+                        logger.warning("Process pool failed, extracting remaining pages in this process: %s", e)
+                        _discard_pool(executor)
+                    page_results[page_index] = self._retry_page(pdf, page_index, skip_xrefs[page_index], filter_logos)
+                except Exception as e:
+                    logger.error("Error processing page %s in a worker, retrying here: %s", page_index + 1, e)
+                    page_results[page_index] = self._retry_page(pdf, page_index, skip_xrefs[page_index], filter_logos)
+                
+                # Merge pages in order so content deduplication keeps the same images as a serial run
+                while next_page in page_results:
+                    yield from self._merge_page(*page_results.pop(next_page))
+                    next_page += 1
+        finally:
+            # Drop this run's queued pages when the caller stops early (e.g. a Streamlit rerun)
+            for future in futures:
+                future.cancel()
+    
+    def _retry_page(self, pdf, page_index: int, skip_xrefs: set,
+                    filter_logos: bool = True) -> Tuple[List[Tuple[str, bytes]], Dict]:
+        """
+        Extract a page in this process after its worker failed.
+        
+        Args:
+            pdf: PDF document object
+            page_index: Index of the page
+            skip_xrefs: Image xrefs handled by an earlier page
+            filter_logos: Whether to filter out logo-like images
+            
+        Returns:
+            Page results in the same form as _process_page. If extraction fails
+            again, the page's images are counted as failed extractions.
+        """
+        try:
+            return _extract_page(pdf, page_index, str(self.output_folder), filter_logos, skip_xrefs)
+        except Exception as e:
+            logger.error("Error processing page %s: %s", page_index + 1, e)
+            lost = {img[0] for img in pdf[page_index].get_images(full=False)} - skip_xrefs
+            return [], {"failed_extractions": len(lost)}
     
-    def _extract_images_from_page(self, page, page_index: int, pdf, filter_logos: bool = True) -> None:
+    def _merge_page(self, images: List[Tuple[str, bytes]], page_stats: Dict) -> Iterator[Tuple[str, Dict]]:
+        """
+        Add a worker's page results, deleting images whose content an earlier page already produced.
+        
+        Args:
+            images: (image_path, content_digest) pairs returned by the worker
+            page_stats: Statistics dictionary returned by the worker
+            
+        Yields:
+            Tuples of (image_path, running_stats) for the images that were kept
+        """
+        self._merge_stats(page_stats)
+        
+        paths = []
+        for path, digest in images:
+            if digest not in self._seen_hashes:
+                self._seen_hashes.add(digest)
+                paths.append(path)
+                continue
+            
+            size = 0
+            try:
+                size = os.path.getsize(path)
+                os.remove(path)
+            except OSError as e:
+                logger.warning("Could not remove duplicate image %s: %s", path, e)
+            logger.debug("Removed duplicate image %s", path)
+            self.stats["successful_extractions"] -= 1
+            self.stats["total_images"] -= 1
+            self.stats["total_size_mb"] -= size / (1024 * 1024)
+        
+        self.extracted_images.extend(paths)
+        stats = self.get_extraction_stats()
+        for path in paths:
+            yield path, stats
+    
+    def _add_results(self, paths: List[str], n_ok: int, n_failed: int, n_filtered: int, size_bytes: int) -> None:
+        """
+        Add accumulated extraction results to the extracted images and statistics.
+        
+        Args:
+            paths: Paths of successfully extracted images
+            n_ok: Number of successful extractions
+            n_failed: Number of failed extractions
+            n_filtered: Number of images filtered as logos
+            size_bytes: Total size of the extracted images in bytes
+        """
+        self.extracted_images.extend(paths)
+        self.stats["successful_extractions"] += n_ok
+        self.stats["total_images"] += n_ok
+        self.stats["failed_extractions"] += n_failed
+        self.stats["filtered_logos"] += n_filtered
+        self.stats["total_size_mb"] += size_bytes / (1024 * 1024)
+    
+    def _merge_stats(self, page_stats: Dict) -> None:
+        """
+        Add per-page statistics from a worker to the running totals.
+        
+        Args:
+            page_stats: Statistics dictionary returned by a worker
+        """
+        for key, value in page_stats.items():
+            if key != "total_pages":
+                self.stats[key] += value
+    
+    def _extract_images_from_page(self, page, page_index: int, pdf,
+                                  filter_logos: bool = True) -> Tuple[List[str], int, int, int, int]:
         """
         Extract images from a single page.
         
@@ -89,29 +376,47 @@ class PDFImageExtractor:
             page_index: Index of the page
             pdf: PDF document object
             filter_logos: Whether to filter out logo-like images
+            
+        Returns:
+            Tuple of (paths, n_ok, n_failed, n_filtered, size_bytes) for the page
         """
+        paths = []
+        n_failed = 0
+        n_filtered = 0
+        size_bytes = 0
+        
         try:
             # Get images from page
-            images = page.get_images(full=True)
+            images = page.get_images(full=False)
             
             if not images:
-                logger.debug(f"No images found on page {page_index + 1}")
-                return
+                logger.debug("No images found on page %s", page_index + 1)
+                return paths, 0, 0, 0, 0
             
-            logger.debug(f"Found {len(images)} images on page {page_index + 1}")
+            logger.debug("Found %s images on page %s", len(images), page_index + 1)
             
             # Process each image
             for img_index, img in enumerate(images):
                 try:
-                    self._extract_single_image(img, page_index, img_index, pdf, filter_logos)
+                    path, size, filtered = self._extract_single_image(img, page_index, img_index, pdf, filter_logos)
                 except Exception as e:
-                    logger.error(f"Failed to extract image {img_index + 1} from page {page_index + 1}: {e}")
-                    self.stats["failed_extractions"] += 1
+                    logger.error("Failed to extract image %s from page %s: %s", img_index + 1, page_index + 1, e)
+                    n_failed += 1
+                    continue
+                
+                if path:
+                    paths.append(path)
+                    size_bytes += size
+                elif filtered:
+                    n_filtered += 1
                     
         except Exception as e:
-            logger.error(f"Error processing page {page_index + 1}: {e}")
+            logger.error("Error processing page %s: %s", page_index + 1, e)
+        
+        return paths, len(paths), n_failed, n_filtered, size_bytes
     
-    def _extract_single_image(self, img, page_index: int, img_index: int, pdf, filter_logos: bool = True) -> None:
+    def _extract_single_image(self, img, page_index: int, img_index: int, pdf,
+                              filter_logos: bool = True) -> Tuple[Optional[str], int, bool]:
         """
         Extract a single image from the PDF.
         
@@ -121,71 +426,115 @@ class PDFImageExtractor:
             img_index: Image index on the page
             pdf: PDF document object
             filter_logos: Whether to filter out logo-like images
+            
+        Returns:
+            Tuple of (path, size_bytes, filtered). path is None when the image was
+            skipped; filtered is True when it was skipped as logo-like.
         """
         try:
             xref = img[0]
-            base_image = pdf.extract_image(xref)
+            if xref in self._seen_xrefs:
+                logger.debug("Skipping already extracted image xref %s on page %s", xref, page_index + 1)
+                return None, 0, False
+            self._seen_xrefs.add(xref)
+            
+            image_data = self._read_image_data(pdf, xref)
             
-            if not base_image:
-                logger.warning(f"Could not extract image data for image {img_index + 1} on page {page_index + 1}")
-                return
+            if not image_data:
+                logger.warning("Could not extract image data for image %s on page %s", img_index + 1, page_index + 1)
+                return None, 0, False
             
-            image_bytes = base_image["image"]
-            image_ext = base_image["ext"].lower()
+            image_bytes, image_ext = image_data
             
             # Check if image format is supported
             if image_ext not in SUPPORTED_IMAGE_FORMATS:
-                logger.warning(f"Unsupported image format: {image_ext}")
-                return
+                logger.warning("Unsupported image format: %s", image_ext)
+                return None, 0, False
             
             # Check minimum image size
             image_size_kb = len(image_bytes) / 1024
             if image_size_kb < MIN_IMAGE_SIZE_KB:
-                logger.debug(f"Image too small ({image_size_kb:.1f}KB), skipping")
-                return
+                logger.debug("Image too small (%.1fKB), skipping", image_size_kb)
+                return None, 0, False
             
-            # Logo filtering
-            if filter_logos and self._is_logo_like(image_bytes):
-                logger.debug(f"Filtered out logo-like image {img_index + 1} from page {page_index + 1}")
-                self.stats["filtered_logos"] += 1
-                return
+            # Logo filtering, deciding small images from their size alone
+            if filter_logos and (image_size_kb < LOGO_MAX_SIZE_KB or self._is_logo_like(image_bytes, image_ext)):
+                logger.debug("Filtered out logo-like image %s from page %s", img_index + 1, page_index + 1)
+                return None, 0, True
             
-            # Generate filename
-            image_filename = f"page{page_index+1}_img{img_index+1}.{image_ext}"
-            full_path = self.output_folder / image_filename
+            # Skip identical content stored under a different xref
+            digest = hashlib.blake2b(image_bytes, digest_size=16).digest()
+            if digest in self._seen_hashes:
+                logger.debug("Skipping duplicate image %s on page %s", img_index + 1, page_index + 1)
+                return None, 0, False
+            self._seen_hashes.add(digest)
             
-            # Save image
-            with open(full_path, "wb") as f:
-                f.write(image_bytes)
+            # Generate path
+            full_path = f"{self._out_prefix}page{page_index+1}_img{img_index+1}.{image_ext}"
+            self._digests[full_path] = digest
             
-            # Update stats
-            self.extracted_images.append(str(full_path))
-            self.stats["successful_extractions"] += 1
-            self.stats["total_images"] += 1
-            self.stats["total_size_mb"] += len(image_bytes) / (1024 * 1024)
+            # Queue image for the background writer
+            self._write_queue.put((full_path, image_bytes))
             
-            logger.debug(f"Successfully extracted: {full_path}")
+            logger.debug("Successfully extracted: %s", full_path)
+            return full_path, len(image_bytes), False
             
         except Exception as e:
-            logger.error(f"Error extracting single image: {e}")
+            logger.error("Error extracting single image: %s", e)
             raise ImageExtractionError(f"Failed to extract image: {e}")
     
-    def _is_logo_like(self, image_bytes: bytes) -> bool:
+    def _read_image_data(self, pdf, xref: int) -> Optional[Tuple[bytes, str]]:
+        """
+        Read the image bytes and format for an xref.
+        
+        JPEG streams are returned as stored in the PDF; other filters go
+        through PyMuPDF's decoding.
+        
+        Args:
+            pdf: PDF document object
+            xref: Image xref number
+            
+        Returns:
+            Tuple of (image_bytes, image_ext), or None if no data could be read
+        """
+        filter_type, filter_value = pdf.xref_get_key(xref, "Filter")
+        if filter_type in ("name", "array"):
+            raw_ext = RAW_STREAM_FORMATS.get(filter_value.strip("[] "))
+            if raw_ext:
+                return pdf.xref_stream_raw(xref), raw_ext
+        
+        base_image = pdf.extract_image(xref)
+        if not base_image:
+            return None
+        return base_image["image"], base_image["ext"].lower()
+    
+    def _is_logo_like(self, image_bytes: bytes, image_ext: str = "") -> bool:
         """
         Check if an image is logo-like based on various criteria.
         
         Args:
             image_bytes: Image data in bytes
+            image_ext: Image format extension, used to read the header directly
             
         Returns:
             True if the image appears to be a logo
         """
         try:
-            # Convert bytes to PIL Image
-            image = Image.open(io.BytesIO(image_bytes))
+            # Check file size first (logos are often small), no parsing needed
+            if len(image_bytes) < LOGO_MAX_SIZE_KB * 1024:
+                return True
             
-            # Get image dimensions
-            width, height = image.size
+            # Read dimensions from the header, falling back to PIL for unknown layouts
+            probe = _fast_probe(image_bytes, image_ext)
+            if probe is None:
+                import io
+                from PIL import Image
+                
+                image = Image.open(io.BytesIO(image_bytes))
+                width, height = image.size
+                has_alpha = image.mode in ('RGBA', 'LA', 'P')
+            else:
+                width, height, has_alpha = probe
             
             # Check if image is very small (likely a logo)
             if width < 100 or height < 100:
@@ -196,12 +545,8 @@ class PDFImageExtractor:
             if 0.8 <= aspect_ratio <= 1.2:  # Square-ish
                 return True
             
-            # Check if image has transparency (common in logos)
-            if image.mode in ('RGBA', 'LA', 'P'):
-                return True
-            
-            # Check file size (logos are often small)
-            if len(image_bytes) < 10 * 1024:  # Less than 10KB
+            # Check if image has transparency or a palette (common in logos)
+            if has_alpha:
                 return True
             
             # Additional checks could be added here:
@@ -212,7 +557,7 @@ class PDFImageExtractor:
             return False
             
         except Exception as e:
-            logger.error(f"Error analyzing image for logo detection: {e}")
+            logger.error("Error analyzing image for logo detection: %s", e)
             return False
     
     def get_extraction_stats(self) -> Dict:
@@ -242,7 +587,7 @@ class PDFImageExtractor:
                 if optimized_path:
                     optimized_images.append(optimized_path)
             except Exception as e:
-                logger.error(f"Error optimizing image {image_path}: {e}")
+                logger.error("Error optimizing image %s: %s", image_path, e)
         
         return optimized_images
     
@@ -258,6 +603,8 @@ class PDFImageExtractor:
             Path to optimized image or None if optimization failed
         """
         try:
+            from PIL import Image
+            
             with Image.open(image_path) as img:
                 # Convert to RGB if necessary
                 if img.mode in ('RGBA', 'LA', 'P'):
@@ -270,13 +617,207 @@ class PDFImageExtractor:
                 # Save optimized image
                 img.save(optimized_path, quality=quality, optimize=True)
                 
-                logger.debug(f"Optimized image saved: {optimized_path}")
+                logger.debug("Optimized image saved: %s", optimized_path)
                 return str(optimized_path)
                 
         except Exception as e:
-            logger.error(f"Error optimizing image {image_path}: {e}")
+            logger.error("Error optimizing image %s: %s", image_path, e)
             return None
 
+def _fast_probe(image_bytes: bytes, image_ext: str) -> Optional[Tuple[int, int, bool]]:
+    """
+    Read image dimensions straight from the file header without decoding.
+    
+    Args:
+        image_bytes: Image data in bytes
+        image_ext: Image format extension
+        
+    Returns:
+        Tuple of (width, height, has_alpha), or None if the header could not be parsed
+        or only PIL can tell the mode. has_alpha is True for images PIL would open as RGBA, LA or P.
+    """
+    try:
+        if image_ext == "png":
+            if image_bytes[:8] != b"\x89PNG\r\n\x1a\n":
+                return None
+            width, height = struct.unpack(">II", image_bytes[16:24])
+            color_type = image_bytes[25]
+            return width, height, bool(color_type & 4) or color_type == 3
+        
+        if image_ext in ("jpeg", "jpg"):
+            if image_bytes[:2] != b"\xff\xd8":
+                return None
+            i = 2
+            size = len(image_bytes)
+            while i + 9 < size:
+                if image_bytes[i] != 0xFF:
+                    return None
+                marker = image_bytes[i + 1]
+                if marker == 0xFF:  # Fill byte
+                    i += 1
+                    continue
+                if 0xD0 <= marker <= 0xD7 or marker == 0x01:  # Markers without a length
+                    i += 2
+                    continue
+                if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                    height, width = struct.unpack(">HH", image_bytes[i + 5:i + 9])
+                    return width, height, False
+                i += 2 + struct.unpack(">H", image_bytes[i + 2:i + 4])[0]
+            return None
+        
+        # GIF and low bit-depth BMP are left to PIL, since whether they open as
+        # a palette ("P") or as grayscale/bilevel ("L"/"1") depends on their colours
+        if image_ext == "bmp":
+            if image_bytes[:2] != b"BM":
+                return None
+            bits_per_pixel = struct.unpack("<H", image_bytes[28:30])[0]
+            if bits_per_pixel <= 8:
+                return None
+            width, height = struct.unpack("<ii", image_bytes[18:26])
+            return width, abs(height), False
+        
+    except (struct.error, IndexError):
+        pass
+    
+    return None
+
+def _write_bytes(path, data: bytes) -> None:
+    """
+    Write bytes to a file using raw file descriptors.
+    
+    Args:
+        path: Destination file path
+        data: Bytes to write
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+def _get_pool() -> ProcessPoolExecutor:
+    """
+    Get the shared process pool, starting it on first use.
+    
+    Workers are started with spawn rather than fork, since the caller may be a
+    multi-threaded server such as Streamlit. Keeping one pool for the process
+    lifetime means that start-up cost is only paid once.
+    
+    Returns:
+        Process pool executor
+    """
+    global _pool
+    
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _pool
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    """
+    Shut down a pool whose workers died and stop using process pools in this process.
+    
+    Args:
+        pool: The broken pool
+    """
+    global _pool, _pool_broken
+    
+    with _pool_lock:
+        _pool_broken = True
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def _assign_xrefs_to_pages(pdf) -> Tuple[List[set], int]:
+    """
+    Assign each image xref to the first page that uses it.
+    
+    Args:
+        pdf: PDF document object
+        
+    Returns:
+        Tuple of (skip_xrefs, image_count): per page, the xrefs handled by an
+        earlier page, and the number of distinct images in the document
+    """
+    first_page = {}
+    skip_xrefs = []
+    for page_index in range(len(pdf)):
+        skip = set()
+        for img in pdf[page_index].get_images(full=False):
+            if first_page.setdefault(img[0], page_index) != page_index:
+                skip.add(img[0])
+        skip_xrefs.append(skip)
+    return skip_xrefs, len(first_page)
+
+def _get_worker_pdf(pdf_path: str):
+    """
+    Get the PDF document for the current worker process, opening it once.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        
+    Returns:
+        PDF document object
+    """
+    global _worker_pdf, _worker_pdf_key
+    
+    # Workers outlive a single extraction, so reopen when the file changes
+    key = (pdf_path, os.path.getmtime(pdf_path))
+    if _worker_pdf_key != key:
+        if _worker_pdf is not None:
+            _worker_pdf.close()
+        _worker_pdf = fitz.open(pdf_path)
+        _worker_pdf_key = key
+    return _worker_pdf
+
+def _process_page(pdf_path: str, page_index: int, output_folder: str,
+                  filter_logos: bool = True, skip_xrefs=()) -> Tuple[List[Tuple[str, bytes]], Dict]:
+    """
+    Extract images from a single page inside a worker process.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        page_index: Index of the page
+        output_folder: Directory to save extracted images
+        filter_logos: Whether to filter out logo-like images
+        skip_xrefs: Image xrefs handled by an earlier page
+        
+    Returns:
+        Tuple of ([(image_path, content_digest), ...], partial_stats) for the page.
+        Digests let the parent drop content already extracted from another page.
+    """
+    return _extract_page(_get_worker_pdf(pdf_path), page_index, output_folder, filter_logos, skip_xrefs)
+
+def _extract_page(pdf, page_index: int, output_folder: str,
+                  filter_logos: bool = True, skip_xrefs=()) -> Tuple[List[Tuple[str, bytes]], Dict]:
+    """
+    Extract images from a single page with a standalone extractor.
+    
+    Args:
+        pdf: PDF document object
+        page_index: Index of the page
+        output_folder: Directory to save extracted images
+        filter_logos: Whether to filter out logo-like images
+        skip_xrefs: Image xrefs handled by an earlier page
+        
+    Returns:
+        Tuple of ([(image_path, content_digest), ...], partial_stats) for the page
+    """
+    extractor = PDFImageExtractor(output_folder)
+    extractor._seen_xrefs.update(skip_xrefs)
+    extractor._start_writer()
+    try:
+        extractor._add_results(*extractor._extract_images_from_page(pdf[page_index], page_index, pdf, filter_logos))
+    finally:
+        extractor._stop_writer()
+    return [(path, extractor._digests[path]) for path in extractor.extracted_images], extractor.stats
+
 def extract_images_from_pdf(pdf_path: str, output_folder: str = OUTPUT_FOLDER) -> List[str]:
     """
     Convenience function to extract images from a PDF.
@@ -291,6 +832,23 @@ def extract_images_from_pdf(pdf_path: str, output_folder: str = OUTPUT_FOLDER) -
     extractor = PDFImageExtractor(output_folder)
     return extractor.extract_images_from_pdf(pdf_path)
 
+def extract_images_iter(pdf_path: str, output_folder: str = OUTPUT_FOLDER,
+                        progress_callback=None, filter_logos: bool = True) -> Iterator[Tuple[str, Dict]]:
+    """
+    Extract images, yielding each one as soon as it is saved.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        output_folder: Directory to save extracted images
+        progress_callback: Optional callback function for progress updates
+        filter_logos: Whether to filter out logo-like images
+        
+    Yields:
+        Tuples of (image_path, running_stats)
+    """
+    extractor = PDFImageExtractor(output_folder)
+    yield from extractor.iter_images(pdf_path, progress_callback, filter_logos)
+
 def extract_images_with_progress(pdf_path: str, output_folder: str = OUTPUT_FOLDER, 
                                progress_callback=None, filter_logos: bool = True) -> Tuple[List[str], Dict]:
     """
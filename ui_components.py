@@ -2,12 +2,22 @@
 UI components for the PDF Image Extractor application.
 """
 import streamlit as st
+import pandas as pd
 from typing import List, Dict, Optional
 from pathlib import Path
 import base64
+import io
+import os
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from logger import get_logger
-from config import IFRAME_HEIGHT, SPINNER_TEXT, SUCCESS_MESSAGE, WARNING_MESSAGE, ERROR_MESSAGE
-from utils import get_image_info, format_file_size
+from config import (
+    IFRAME_HEIGHT, SPINNER_TEXT, SUCCESS_MESSAGE, WARNING_MESSAGE, ERROR_MESSAGE,
+    IMAGE_CACHE_MAX_ENTRIES, ZIP_CACHE_MAX_ENTRIES, ZIP_READ_WORKERS, STYLESHEET_FILE,
+    THUMBNAIL_SIZE, THUMBNAIL_QUALITY
+)
+from utils import get_image_info, format_file_size, zip_compression_for
 
 logger = get_logger(__name__)
 
@@ -20,183 +30,17 @@ def render_header():
     )
     
     # Custom CSS for modern styling
-    st.markdown("""
-    <style>
-    /* Modern styling */
-    .main {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        min-height: 100vh;
-    }
-    
-    .stApp {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    }
-    
-    /* Header styling */
-    h1 {
-        color: white !important;
-        text-align: center;
-        font-size: 2.5rem;
-        font-weight: 700;
-        margin-bottom: 0.5rem;
-        text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-    }
-    
-    /* Subheader styling */
-    h2 {
-        color: white !important;
-        font-size: 1.8rem;
-        font-weight: 600;
-        margin-top: 2rem;
-        margin-bottom: 1rem;
-    }
-    
-    h3 {
-        color: white !important;
-        font-size: 1.4rem;
-        font-weight: 600;
-    }
-    
-    /* Container styling */
-    .stContainer {
-        background: rgba(255, 255, 255, 0.95);
-        border-radius: 15px;
-        padding: 20px;
-        margin: 10px 0;
-        box-shadow: 0 8px 32px rgba(0,0,0,0.1);
-        backdrop-filter: blur(10px);
-        border: 1px solid rgba(255, 255, 255, 0.2);
-    }
-    
-    /* Button styling */
-    .stButton > button {
-        background: linear-gradient(45deg, #667eea, #764ba2);
-        color: white;
-        border: none;
-        border-radius: 25px;
-        padding: 10px 20px;
-        font-weight: 600;
-        transition: all 0.3s ease;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.2);
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 20px rgba(0,0,0,0.3);
-        background: linear-gradient(45deg, #764ba2, #667eea);
-    }
-    
-    /* File uploader styling */
-    .stFileUploader {
-        background: rgba(255, 255, 255, 0.9);
-        border-radius: 15px;
-        padding: 20px;
-        border: 2px dashed #667eea;
-    }
-    
-    /* Progress bar styling */
-    .stProgress > div > div > div {
-        background: linear-gradient(45deg, #667eea, #764ba2);
-    }
-    
-    /* Success message styling */
-    .stAlert {
-        background: rgba(76, 175, 80, 0.9);
-        border-radius: 10px;
-        border: none;
-    }
-    
-    /* Warning message styling */
-    .stAlert[data-baseweb="notification"] {
-        background: rgba(255, 193, 7, 0.9);
-        border-radius: 10px;
-        border: none;
-    }
-    
-    /* Error message styling */
-    .stAlert[data-baseweb="toast"] {
-        background: rgba(244, 67, 54, 0.9);
-        border-radius: 10px;
-        border: none;
-    }
-    
-    /* Sidebar styling */
-    .css-1d391kg {
-        background: rgba(255, 255, 255, 0.95);
-        border-radius: 15px;
-        margin: 10px;
-        padding: 20px;
-        box-shadow: 0 8px 32px rgba(0,0,0,0.1);
-    }
-    
-    /* Text input styling */
-    .stTextInput > div > div > input {
-        border-radius: 10px;
-        border: 2px solid #e0e0e0;
-        transition: all 0.3s ease;
-    }
-    
-    .stTextInput > div > div > input:focus {
-        border-color: #667eea;
-        box-shadow: 0 0 0 2px rgba(102, 126, 234, 0.2);
-    }
-    
-    /* Checkbox styling */
-    .stCheckbox > label {
-        color: #333;
-        font-weight: 500;
-    }
-    
-    /* Image caption styling */
-    .caption {
-        color: #666;
-        font-size: 0.9rem;
-        text-align: center;
-        margin-top: 5px;
-    }
-    
-    /* Divider styling */
-    hr {
-        border: none;
-        height: 2px;
-        background: linear-gradient(45deg, #667eea, #764ba2);
-        margin: 20px 0;
-        border-radius: 1px;
-    }
-    
-    /* Info box styling */
-    .stAlert[data-baseweb="notification"] {
-        background: rgba(33, 150, 243, 0.9);
-        border-radius: 10px;
-        border: none;
-    }
-    
-    /* Metric styling */
-    .metric-container {
-        background: rgba(255, 255, 255, 0.9);
-        border-radius: 10px;
-        padding: 15px;
-        text-align: center;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-    }
-    
-    .metric-label {
-        font-size: 0.9rem;
-        color: #666;
-        margin-bottom: 5px;
-    }
-    
-    .metric-value {
-        font-size: 1.5rem;
-        font-weight: 700;
-        color: #333;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(_load_css(), unsafe_allow_html=True)
     
     st.title("📄 PDF Image Extractor")
     st.markdown("Extract images from PDF files with ease!")
 
+@st.cache_resource(show_spinner=False)
+def _load_css() -> str:
+    """Load the application stylesheet once per server process."""
+    css = Path(__file__).with_name(STYLESHEET_FILE).read_text(encoding="utf-8")
+    return f"<style>\n{css}</style>"
+
 def render_file_uploader():
     """Render the file uploader component."""
     return st.file_uploader(
@@ -212,8 +56,8 @@ def render_progress_bar(current: int, total: int, text: str = "Processing..."):
     st.progress(progress)
     st.caption(f"{text} ({current}/{total})")
 
-def render_extraction_results(image_paths: List[str], stats: Optional[Dict] = None):
-    """Render the extraction results with photo selection."""
+def render_extraction_results(image_paths: List[str], stats: Optional[Dict] = None, source_key=None):
+    """Render the extraction results with photo selection; source_key identifies the extraction."""
     if not image_paths:
         st.warning(WARNING_MESSAGE)
         return
@@ -227,7 +71,7 @@ def render_extraction_results(image_paths: List[str], stats: Optional[Dict] = No
         render_extraction_stats(stats)
     
     # Display images with selection
-    render_image_selection_gallery(image_paths)
+    render_image_selection_gallery(image_paths, source_key)
 
 def render_extraction_stats(stats: Dict):
     """Render extraction statistics."""
@@ -253,81 +97,131 @@ def render_extraction_stats(stats: Dict):
     if total_size > 0:
         st.info(f"📦 Total extracted size: {total_size:.2f} MB")
 
-def render_image_selection_gallery(image_paths: List[str]):
+def render_image_selection_gallery(image_paths: List[str], source_key=None):
     """Render image gallery with selection for downloads."""
     st.subheader("🖼️ Extracted Images")
     
-    # Initialize session state for selected images and custom names
-    if 'selected_images' not in st.session_state:
-        st.session_state.selected_images = set()
-    if 'custom_names' not in st.session_state:
+    # Reset selection (one flag byte per image), names and table state for each new extraction.
+    # Different PDFs often produce identical file names, so the paths alone can't tell them apart.
+    if source_key is None:
+        source_key = tuple(image_paths)
+    if (st.session_state.get("gallery_source") != source_key
+            or len(st.session_state.get("selected_images", b"")) != len(image_paths)):
+        st.session_state.gallery_source = source_key
+        st.session_state.selected_images = bytearray(len(image_paths))
         st.session_state.custom_names = {}
+        # A new editor key drops edits held in the previous data editor's widget state
+        st.session_state.gallery_version = st.session_state.get("gallery_version", 0) + 1
+        for key in ("gallery_table", "gallery_table_key", "pending_download", "single_download_select"):
+            st.session_state.pop(key, None)
     
-    # Selection controls
-    col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
-    
-    with col1:
-        if st.button("Select All", key="select_all", use_container_width=True):
-            st.session_state.selected_images = set(range(len(image_paths)))
-            st.rerun()
-    
-    with col2:
-        if st.button("Clear Selection", key="clear_selection", use_container_width=True):
-            st.session_state.selected_images = set()
-            st.rerun()
+    # Image grid, sent to the browser as a single element; it doesn't depend on the
+    # selection, so it stays outside the fragment and isn't rebuilt on every edit
+    cards = "".join(_grid_card(i, load_thumbnail(image_path)) for i, image_path in enumerate(image_paths))
+    st.markdown(f'<div class="image-grid">{cards}</div>', unsafe_allow_html=True)
     
-    with col3:
-        selected_count = len(st.session_state.selected_images)
-        st.info(f"Selected: {selected_count}/{len(image_paths)}")
-    
-    with col4:
-        if selected_count > 0:
-            # Download button for selected images
-            if st.button("📦 Download Selected", key="download_selected_btn", use_container_width=True):
-                download_selected_images_quick(image_paths, st.session_state.selected_images)
+    _gallery_body(image_paths)
+
+@st.fragment
+def _gallery_body(image_paths: List[str]):
+    """Render selection controls and the naming table; widget changes rerun only this fragment."""
+    # Controls are filled in after the table so they reflect this run's edits
+    controls = st.container()
+    
+    # Selection and naming table, one widget for all images
+    version = st.session_state.get("gallery_version", 0)
+    table_key = (tuple(image_paths), version)
+    if st.session_state.get("gallery_table_key") != table_key:
+        st.session_state.gallery_table = _gallery_table(image_paths)
+        st.session_state.gallery_table_key = table_key
+    
+    edited = st.data_editor(
+        st.session_state.gallery_table,
+        column_config={
+            "Select": st.column_config.CheckboxColumn("Select"),
+            "Name": st.column_config.TextColumn("Name", help="Custom file name (optional)")
+        },
+        num_rows="fixed",
+        use_container_width=True,
+        key=f"gallery_editor_{version}"
+    )
+    st.session_state.selected_images = bytearray(edited["Select"].astype(bool).tolist())
+    for i, name in enumerate(edited["Name"]):
+        if name:
+            st.session_state.custom_names[i] = name
     
-    # Image grid with selection
-    cols = st.columns(3)
-    for i, image_path in enumerate(image_paths):
-        col_idx = i % 3
+    with controls:
+        col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
         
-        with cols[col_idx]:
-            # Create a container for each image
-            with st.container():
-                # Image display
-                st.image(image_path, use_container_width=True, caption=f"Image {i+1}")
-                
-                # Selection checkbox
-                is_selected = i in st.session_state.selected_images
-                if st.checkbox(f"Select Image {i+1}", value=is_selected, key=f"select_{i}"):
-                    st.session_state.selected_images.add(i)
-                else:
-                    st.session_state.selected_images.discard(i)
-                
-                # Optional name input field
-                default_name = st.session_state.custom_names.get(i, f"image_{i+1}")
-                custom_name = st.text_input(
-                    f"Name for Image {i+1}",
-                    value=default_name,
-                    key=f"name_{i}",
-                    placeholder="Enter custom name (optional)"
-                )
-                if custom_name:
-                    st.session_state.custom_names[i] = custom_name
-                
-                # Individual download button
-                with open(image_path, "rb") as f:
-                    image_data = f.read()
-                    file_name = f"{st.session_state.custom_names.get(i, f'image_{i+1}')}.{Path(image_path).suffix}"
-                    st.download_button(
-                        f"📥 Download Image {i+1}",
-                        image_data,
-                        file_name=file_name,
-                        mime="image/jpeg",
-                        use_container_width=True
+        with col1:
+            if st.button("Select All", key="select_all", use_container_width=True):
+                st.session_state.selected_images = bytearray(b"\x01" * len(image_paths))
+                st.session_state.gallery_version = version + 1
+                st.rerun(scope="fragment")
+        
+        with col2:
+            if st.button("Clear Selection", key="clear_selection", use_container_width=True):
+                st.session_state.selected_images = bytearray(len(image_paths))
+                st.session_state.gallery_version = version + 1
+                st.rerun(scope="fragment")
+        
+        with col3:
+            selected_count = st.session_state.selected_images.count(1)
+            st.info(f"Selected: {selected_count}/{len(image_paths)}")
+        
+        with col4:
+            if selected_count > 0:
+                # Download button for selected images
+                if st.button("📦 Download Selected", key="download_selected_btn", use_container_width=True):
+                    _download_zip_button(
+                        image_paths, _selected_indices(st.session_state.selected_images),
+                        "📥 Download Selected Images", "selected_images.zip", "quick_download_selected_zip"
                     )
-                
-                st.divider()
+    
+    # Single image download, only reading the image once requested
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        i = st.selectbox(
+            "Download a single image",
+            range(len(image_paths)),
+            format_func=lambda idx: f"Image {idx+1} ({st.session_state.custom_names.get(idx, f'image_{idx+1}')})",
+            key="single_download_select"
+        )
+    with col2:
+        if st.session_state.get("pending_download") == i or st.button(
+            "📄 Prepare Download", key="prepare_download", use_container_width=True
+        ):
+            st.session_state.pending_download = i
+            image_path = image_paths[i]
+            image_data = _load_image_bytes(image_path, Path(image_path).stat().st_mtime)
+            file_name = _download_name(st.session_state.custom_names.get(i, f"image_{i+1}"), image_path)
+            st.download_button(
+                f"📥 Download Image {i+1}",
+                image_data,
+                file_name=file_name,
+                mime="image/jpeg",
+                use_container_width=True
+            )
+
+def _grid_card(i: int, thumbnail: Optional[bytes]) -> str:
+    """Build the HTML for one grid item, with a placeholder when no thumbnail is available."""
+    if thumbnail is None:
+        preview = '<div class="image-grid-placeholder">Preview unavailable</div>'
+    else:
+        preview = f'<img src="data:image/jpeg;base64,{base64.b64encode(thumbnail).decode("ascii")}" alt="Image {i+1}"/>'
+    return f'<figure class="image-grid-item">{preview}<figcaption class="caption">Image {i+1}</figcaption></figure>'
+
+def _gallery_table(image_paths: List[str]) -> pd.DataFrame:
+    """Build the selection and naming table from the current session state."""
+    selection = st.session_state.selected_images
+    names = st.session_state.custom_names
+    return pd.DataFrame(
+        {
+            "Select": [bool(flag) for flag in selection],
+            "Name": [names.get(i, f"image_{i+1}") for i in range(len(image_paths))]
+        },
+        index=[f"Image {i+1}" for i in range(len(image_paths))]
+    )
 
 def render_download_section(image_paths: List[str]):
     """Render the download section with selected images."""
@@ -337,19 +231,23 @@ def render_download_section(image_paths: List[str]):
     st.subheader("📦 Download Options")
     
     # Check if any images are selected
-    selected_images = st.session_state.get('selected_images', set())
+    selection = st.session_state.get('selected_images', bytearray())
+    selected_count = selection.count(1)
     
-    if selected_images:
+    if selected_count:
         # Download selected images
         col1, col2 = st.columns(2)
         
         with col1:
             st.markdown("**Download Selected Images**")
-            st.markdown(f"Download {len(selected_images)} selected images.")
+            st.markdown(f"Download {selected_count} selected images.")
             
             # Create ZIP of selected images
             if st.button("📦 Download Selected as ZIP", key="download_selected_main", use_container_width=True):
-                download_selected_images(image_paths, selected_images)
+                _download_zip_button(
+                    image_paths, _selected_indices(selection),
+                    "📥 Download Selected Images", "selected_images.zip", "download_selected_zip"
+                )
         
         with col2:
             st.markdown("**Download All Images**")
@@ -357,90 +255,116 @@ def render_download_section(image_paths: List[str]):
             
             # Create ZIP of all images
             if st.button("📦 Download All as ZIP", key="download_all_main", use_container_width=True):
-                download_all_images(image_paths)
+                _download_zip_button(image_paths, None, "📥 Download All Images", "all_images.zip", "download_all_zip")
     else:
         # No selection - show all download option
         st.markdown("**Download All Images**")
         st.markdown("Download all extracted images in a ZIP file.")
         
         if st.button("📦 Download All as ZIP", key="download_all_single", use_container_width=True):
-            download_all_images(image_paths)
+            _download_zip_button(image_paths, None, "📥 Download All Images", "all_images.zip", "download_all_zip")
+
+def _selected_indices(selection: bytearray) -> List[int]:
+    """Convert the selection flags into a list of selected image indices."""
+    return [i for i, flag in enumerate(selection) if flag]
 
-def download_selected_images(image_paths: List[str], selected_indices: set):
-    """Download selected images as ZIP."""
+def _download_zip_button(image_paths: List[str], indices, label: str, file_name: str, key: str):
+    """Render a download button for a ZIP of the images at the given indices (all if None)."""
     try:
-        import zipfile
-        import tempfile
+        zip_data = _build_zip(image_paths, indices, st.session_state.get('custom_names', {}))
         
-        # Create temporary ZIP file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as tmp_file:
-            with zipfile.ZipFile(tmp_file.name, 'w') as zipf:
-                for idx in selected_indices:
-                    if idx < len(image_paths):
-                        image_path = image_paths[idx]
-                        # Use custom name if available, otherwise use default
-                        custom_name = st.session_state.custom_names.get(idx, f"image_{idx+1}")
-                        arcname = f"{custom_name}.{Path(image_path).suffix}"
-                        zipf.write(image_path, arcname=arcname)
-            
-            # Read the ZIP file
-            with open(tmp_file.name, 'rb') as f:
-                zip_data = f.read()
-            
-            # Clean up
-            import os
-            os.unlink(tmp_file.name)
-            
-            # Create download button
-            st.download_button(
-                "📥 Download Selected Images",
-                zip_data,
-                file_name="selected_images.zip",
-                mime="application/zip",
-                key="download_selected_zip",
-                use_container_width=True
-            )
+        # Create download button
+        st.download_button(
+            label,
+            zip_data,
+            file_name=file_name,
+            mime="application/zip",
+            key=key,
+            use_container_width=True
+        )
             
     except Exception as e:
-        logger.error(f"Error creating selected images ZIP: {e}")
-        st.error("Error creating ZIP file for selected images")
+        logger.error(f"Error creating ZIP file {file_name}: {e}")
+        st.error(f"Error creating ZIP file {file_name}")
+
+def _build_zip(image_paths: List[str], indices=None, names_map: Optional[Dict] = None) -> bytes:
+    """Build an in-memory ZIP of the images at the given indices (all if None)."""
+    if indices is None:
+        indices = range(len(image_paths))
+    if names_map is None:
+        names_map = {}
+    
+    entries = []
+    # Modification times are part of the cache key so rewritten files invalidate it
+    mtimes = []
+    path_count = len(image_paths)
+    for idx in sorted(indices):
+        if idx < path_count:
+            image_path = image_paths[idx]
+            # Use custom name if available, otherwise use default
+            custom_name = names_map.get(idx, f"image_{idx+1}")
+            entries.append((image_path, _download_name(custom_name, image_path)))
+            mtimes.append(os.stat(image_path).st_mtime)
+    
+    return _zip_entries(tuple(entries), tuple(mtimes))
+
+def _download_name(custom_name: str, image_path: str) -> str:
+    """Build a download file name from a custom name and the image's extension."""
+    # The extension from splitext already includes the leading dot
+    return f"{custom_name}{os.path.splitext(image_path)[1]}"
 
-def download_all_images(image_paths: List[str]):
-    """Download all images as ZIP."""
+@st.cache_data(max_entries=ZIP_CACHE_MAX_ENTRIES, show_spinner=False)
+def _zip_entries(entries: tuple, mtimes: tuple) -> bytes:
+    """Create ZIP bytes from (path, arcname) entries, cached across reruns."""
+    buffer = io.BytesIO()
+    # Prefetch a bounded window of files on worker threads so only a few are held in memory at once
+    with ThreadPoolExecutor(max_workers=ZIP_READ_WORKERS) as executor, \
+            zipfile.ZipFile(buffer, 'w') as zipf:
+        pending = deque()
+        for image_path, arcname in entries:
+            pending.append((image_path, arcname, executor.submit(Path(image_path).read_bytes)))
+            if len(pending) >= ZIP_READ_WORKERS:
+                _write_zip_entry(zipf, *pending.popleft())
+        while pending:
+            _write_zip_entry(zipf, *pending.popleft())
+    return buffer.getvalue()
+
+def _write_zip_entry(zipf: zipfile.ZipFile, image_path: str, arcname: str, file_data) -> None:
+    """Write a prefetched file into the archive, keeping the file's modification time."""
+    info = zipfile.ZipInfo.from_file(image_path, arcname)
+    info.compress_type = zip_compression_for(image_path)
+    zipf.writestr(info, file_data.result())
+
+def load_thumbnail(image_path: str) -> Optional[bytes]:
+    """Get a downsized JPEG preview of an image, or None if it can't be read; the original file is left untouched for downloads."""
     try:
-        import zipfile
-        import tempfile
-        
-        # Create temporary ZIP file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as tmp_file:
-            with zipfile.ZipFile(tmp_file.name, 'w') as zipf:
-                for i, image_path in enumerate(image_paths):
-                    # Use custom name if available, otherwise use default
-                    custom_name = st.session_state.custom_names.get(i, f"image_{i+1}")
-                    arcname = f"{custom_name}.{Path(image_path).suffix}"
-                    zipf.write(image_path, arcname=arcname)
-            
-            # Read the ZIP file
-            with open(tmp_file.name, 'rb') as f:
-                zip_data = f.read()
-            
-            # Clean up
-            import os
-            os.unlink(tmp_file.name)
-            
-            # Create download button
-            st.download_button(
-                "📥 Download All Images",
-                zip_data,
-                file_name="all_images.zip",
-                mime="application/zip",
-                key="download_all_zip",
-                use_container_width=True
-            )
-            
+        mtime = Path(image_path).stat().st_mtime
+    except OSError as e:
+        logger.error(f"Error reading image {image_path}: {e}")
+        return None
+    return _thumbnail(image_path, mtime)
+
+@st.cache_data(max_entries=IMAGE_CACHE_MAX_ENTRIES, show_spinner=False)
+def _thumbnail(image_path: str, mtime: float) -> Optional[bytes]:
+    """Create a JPEG thumbnail, cached until the image's modification time changes; None is cached for undecodable images."""
+    from PIL import Image
+    
+    try:
+        with Image.open(image_path) as img:
+            img.thumbnail(THUMBNAIL_SIZE)
+            if img.mode not in ('RGB', 'L'):
+                img = img.convert('RGB')
+            buffer = io.BytesIO()
+            img.save(buffer, "JPEG", quality=THUMBNAIL_QUALITY)
     except Exception as e:
-        logger.error(f"Error creating all images ZIP: {e}")
-        st.error("Error creating ZIP file for all images")
+        logger.error(f"Error creating thumbnail for {image_path}: {e}")
+        return None
+    return buffer.getvalue()
+
+@st.cache_data(max_entries=IMAGE_CACHE_MAX_ENTRIES, show_spinner=False)
+def _load_image_bytes(image_path: str, mtime: float) -> bytes:
+    """Read an image file, cached across reruns until its modification time changes."""
+    return Path(image_path).read_bytes()
 
 def render_error_message(error: str):
     """Render error message."""
@@ -517,42 +441,3 @@ def render_sidebar():
             "optimize_images": optimize_images,
             "preserve_metadata": preserve_metadata
         }
-
-def download_selected_images_quick(image_paths: List[str], selected_indices: set):
-    """Quick download selected images as ZIP."""
-    try:
-        import zipfile
-        import tempfile
-        
-        # Create temporary ZIP file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as tmp_file:
-            with zipfile.ZipFile(tmp_file.name, 'w') as zipf:
-                for idx in selected_indices:
-                    if idx < len(image_paths):
-                        image_path = image_paths[idx]
-                        # Use custom name if available, otherwise use default
-                        custom_name = st.session_state.custom_names.get(idx, f"image_{idx+1}")
-                        arcname = f"{custom_name}.{Path(image_path).suffix}"
-                        zipf.write(image_path, arcname=arcname)
-            
-            # Read the ZIP file
-            with open(tmp_file.name, 'rb') as f:
-                zip_data = f.read()
-            
-            # Clean up
-            import os
-            os.unlink(tmp_file.name)
-            
-            # Create download button
-            st.download_button(
-                "📥 Download Selected Images",
-                zip_data,
-                file_name="selected_images.zip",
-                mime="application/zip",
-                key="quick_download_selected_zip",
-                use_container_width=True
-            )
-            
-    except Exception as e:
-        logger.error(f"Error creating selected images ZIP: {e}")
-        st.error("Error creating ZIP file for selected images")
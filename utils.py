@@ -2,23 +2,35 @@
 Utility functions for file operations and data processing.
 """
 import os
+import hashlib
+import tempfile
+import threading
 import zipfile
 import shutil
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Iterator, Optional, List, Tuple
 import streamlit as st
 from logger import get_logger
 from exceptions import FileOperationError, FileValidationError
-from config import UPLOAD_FOLDER, OUTPUT_FOLDER, MAX_FILE_SIZE_MB, is_valid_file_type, is_valid_file_size
+from config import (
+    UPLOAD_FOLDER, OUTPUT_FOLDER, MAX_FILE_SIZE_MB, UPLOAD_CHUNK_SIZE,
+    PRECOMPRESSED_IMAGE_EXTENSIONS, IMAGE_INFO_CACHE_MAX_ENTRIES, is_valid_file_type, is_valid_file_size
+)
 
 logger = get_logger(__name__)
 
-def save_uploaded_file(uploaded_file) -> str:
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+def save_uploaded_file(uploaded_file, file_hash: Optional[str] = None) -> str:
     """
     Save an uploaded file to the uploads directory.
     
     Args:
         uploaded_file: Streamlit uploaded file object
+        file_hash: Optional digest of the file contents. When given, the file is
+            saved as <file_hash>.pdf and an existing copy is reused, so a file
+            that is already open elsewhere is never rewritten.
         
     Returns:
         Path to the saved file
@@ -39,10 +51,22 @@ def save_uploaded_file(uploaded_file) -> str:
         upload_path = Path(UPLOAD_FOLDER)
         upload_path.mkdir(exist_ok=True)
         
-        # Save file
-        file_path = upload_path / uploaded_file.name
-        with open(file_path, "wb") as f:
-            f.write(uploaded_file.getbuffer())
+        file_path = upload_path / (f"{file_hash}.pdf" if file_hash else uploaded_file.name)
+        if file_hash and file_path.exists():
+            logger.debug(f"Reusing saved file: {file_path}")
+            return str(file_path)
+        
+        # Save file in chunks to avoid an extra in-memory copy, then move it into
+        # place so readers never see a partly written file
+        uploaded_file.seek(0)  # Earlier reads may have moved the stream position
+        fd, temp_path = tempfile.mkstemp(dir=upload_path, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                shutil.copyfileobj(uploaded_file, f, length=UPLOAD_CHUNK_SIZE)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
         
         logger.info(f"File saved successfully: {file_path}")
         return str(file_path)
@@ -51,23 +75,72 @@ def save_uploaded_file(uploaded_file) -> str:
         logger.error(f"Error saving uploaded file: {e}")
         raise FileOperationError(f"Failed to save uploaded file: {e}")
 
+def compute_file_hash(file_obj) -> str:
+    """
+    Compute a digest of a file-like object, reading it in chunks.
+    
+    Args:
+        file_obj: Readable, seekable file object (e.g. Streamlit uploaded file)
+        
+    Returns:
+        Hex digest of the file contents
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    file_obj.seek(0)
+    for chunk in iter(lambda: file_obj.read(UPLOAD_CHUNK_SIZE), b""):
+        hasher.update(chunk)
+    file_obj.seek(0)
+    return hasher.hexdigest()
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _shared_pdf(file_hash: str, file_path: str):
+    """
+    Open a PDF once per server process, together with the lock guarding it.
+    
+    Args:
+        file_hash: Digest of the file contents, used as the cache key
+        file_path: Path to the content-addressed PDF file
+        
+    Returns:
+        Tuple of (document, lock)
+    """
+    import fitz  # PyMuPDF
+    
+    return fitz.open(file_path), threading.Lock()
+
+@contextmanager
+def borrow_pdf(file_hash: str, file_path: str) -> Iterator:
+    """
+    Use the shared document for a PDF, one session at a time.
+    
+    PyMuPDF documents are not thread-safe and Streamlit runs each session's
+    script on its own thread, so the document's lock is held while in use.
+    
+    Args:
+        file_hash: Digest of the file contents
+        file_path: Path to the PDF, saved under its digest by save_uploaded_file
+        
+    Yields:
+        Opened PyMuPDF document, left open afterwards
+    """
+    pdf, lock = _shared_pdf(file_hash, file_path)
+    with lock:
+        yield pdf
+
 def clear_output_folder(folder: str) -> None:
     """
-    Clear all files from the output folder.
+    Clear the output folder, leaving it empty.
     
     Args:
         folder: Path to the folder to clear
     """
     try:
         folder_path = Path(folder)
+        # Remove the whole tree in one native traversal, then recreate it
         if folder_path.exists():
-            for file_path in folder_path.iterdir():
-                if file_path.is_file():
-                    file_path.unlink()
-                    logger.debug(f"Deleted file: {file_path}")
-        else:
-            folder_path.mkdir(parents=True, exist_ok=True)
-            logger.debug(f"Created folder: {folder_path}")
+            shutil.rmtree(folder_path, ignore_errors=True)
+        folder_path.mkdir(parents=True, exist_ok=True)
+        logger.debug(f"Cleared folder: {folder_path}")
     except Exception as e:
         logger.error(f"Error clearing output folder: {e}")
         raise FileOperationError(f"Failed to clear output folder: {e}")
@@ -87,10 +160,11 @@ def zip_images(folder_path: str, zip_name: str = "extracted_images.zip") -> str:
         folder = Path(folder_path)
         zip_path = folder.parent / zip_name
         
-        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-            for file_path in folder.iterdir():
-                if file_path.is_file():
-                    zipf.write(file_path, arcname=file_path.name)
+        with zipfile.ZipFile(zip_path, "w") as zipf:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        zipf.write(entry.path, arcname=entry.name, compress_type=zip_compression_for(entry.path))
         
         logger.info(f"ZIP file created: {zip_path}")
         return str(zip_path)
@@ -99,6 +173,20 @@ def zip_images(folder_path: str, zip_name: str = "extracted_images.zip") -> str:
         logger.error(f"Error creating ZIP file: {e}")
         raise FileOperationError(f"Failed to create ZIP file: {e}")
 
+def zip_compression_for(file_path) -> int:
+    """
+    Choose the ZIP compression method for a file.
+    
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        ZIP_STORED for already-compressed image formats, ZIP_DEFLATED otherwise
+    """
+    if os.path.splitext(file_path)[1].lower() in PRECOMPRESSED_IMAGE_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
 def get_file_size_mb(file_path: str) -> float:
     """
     Get file size in megabytes.
@@ -126,11 +214,12 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Formatted size string
     """
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.1f} B"
+    
+    # Each unit step is 10 bits, so the bit length picks the unit directly
+    unit = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (unit * 10)):.1f} {_SIZE_UNITS[unit]}"
 
 def cleanup_temp_files() -> None:
     """
@@ -146,12 +235,14 @@ def cleanup_temp_files() -> None:
     except Exception as e:
         logger.warning(f"Error during cleanup: {e}")
 
-def validate_pdf_file(file_path: str) -> Tuple[bool, str]:
+def validate_pdf_file(file_path: str, file_hash: Optional[str] = None) -> Tuple[bool, str]:
     """
     Validate if a file is a valid PDF.
     
     Args:
         file_path: Path to the file to validate
+        file_hash: Optional digest of the file contents; when given, the file must have
+            been saved under it and the shared document is borrowed so extraction can reuse it
         
     Returns:
         Tuple of (is_valid, error_message)
@@ -163,8 +254,12 @@ def validate_pdf_file(file_path: str) -> Tuple[bool, str]:
         if not Path(file_path).exists():
             return False, "File does not exist"
         
-        # Try to open as PDF
-        with fitz.open(file_path) as pdf:
+        # Reject empty files without parsing them
+        if os.path.getsize(file_path) == 0:
+            return False, "PDF file is empty"
+        
+        # Try to open as PDF, leaving shared documents open
+        with borrow_pdf(file_hash, file_path) if file_hash else fitz.open(file_path) as pdf:
             if len(pdf) == 0:
                 return False, "PDF file is empty"
             
@@ -185,6 +280,28 @@ def get_image_info(image_path: str) -> dict:
     Args:
         image_path: Path to the image file
         
+    Returns:
+        Dictionary containing image information
+    """
+    try:
+        stat = Path(image_path).stat()
+    except Exception as e:
+        logger.error(f"Error getting image info: {e}")
+        return {}
+    
+    # Modification time and size are part of the cache key so changed files are re-read
+    return _get_image_info(image_path, stat.st_mtime, stat.st_size)
+
+@st.cache_data(max_entries=IMAGE_INFO_CACHE_MAX_ENTRIES, show_spinner=False)
+def _get_image_info(image_path: str, mtime: float, size_bytes: int) -> dict:
+    """
+    Read image information, cached across reruns.
+    
+    Args:
+        image_path: Path to the image file
+        mtime: File modification time
+        size_bytes: File size in bytes
+        
     Returns:
         Dictionary containing image information
     """
@@ -196,7 +313,7 @@ def get_image_info(image_path: str) -> dict:
                 "format": img.format,
                 "mode": img.mode,
                 "size": img.size,
-                "file_size": format_file_size(Path(image_path).stat().st_size)
+                "file_size": format_file_size(size_bytes)
             }
     except Exception as e:
         logger.error(f"Error getting image info: {e}")